@@ -86,5 +86,10 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        # Uvicorn ignores (and warns about) workers when reloading
+        workers=None if settings.reload else settings.workers,
+        loop=settings.loop,
+        http=settings.http,
+        limit_concurrency=settings.limit_concurrency,
         log_level=settings.log_level.lower()
     )
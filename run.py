@@ -13,7 +13,12 @@ if __name__ == "__main__":
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.reload and settings.is_development,
+        reload=settings.reload,
+        # Uvicorn ignores (and warns about) workers when reloading
+        workers=None if settings.reload else settings.workers,
+        loop=settings.loop,
+        http=settings.http,
+        limit_concurrency=settings.limit_concurrency,
         log_level=settings.log_level.lower(),
         access_log=True,
     )
@@ -5,8 +5,8 @@ set -e
 
 echo "🧪 Running tests..."
 
-# Run tests with coverage
-uv run pytest --cov=src --cov-report=term-missing --cov-report=html
+# Run tests with coverage, one worker per test module
+uv run pytest -n auto --dist=loadfile --cov=src --cov-report=term-missing --cov-report=html
 
 echo "✅ Tests completed!"
 echo "📊 Coverage report: htmlcov/index.html"
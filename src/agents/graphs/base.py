@@ -1,4 +1,5 @@
 """Graph builders for different agent workflows."""
+from collections import OrderedDict
 from typing import Optional
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import tools_condition
@@ -161,11 +162,18 @@ class GraphFactory:
         "writer": WriterGraphBuilder
     }
     
+    # Compiled graphs reused across requests, least recently used first
+    _graphs: "OrderedDict[tuple, StateGraph]" = OrderedDict()
+    _max_cached_graphs = 32
+    
     @classmethod
     def create(cls, graph_type: str, llm: BaseLLM, **kwargs) -> StateGraph:
         """
         Create graph based on type.
         
+        Compiled graphs are cached per graph type, LLM configuration and
+        builder arguments, so repeated requests skip graph compilation.
+        
         Args:
             graph_type: Type of graph to create
             llm: LLM instance
@@ -179,12 +187,33 @@ class GraphFactory:
                 f"Unknown graph type: {graph_type}. Available: {list(cls._builders.keys())}"
             )
         
+        key = (
+            graph_type,
+            type(llm),
+            llm.model_name,
+            llm.temperature,
+            tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in sorted(kwargs.items())
+            ),
+        )
+        graph = cls._graphs.get(key)
+        if graph is not None:
+            cls._graphs.move_to_end(key)
+            return graph
+        
         builder_class = cls._builders[graph_type]
         builder = builder_class(llm, **kwargs)
-        return builder.build()
+        graph = builder.build()
+        
+        cls._graphs[key] = graph
+        if len(cls._graphs) > cls._max_cached_graphs:
+            cls._graphs.popitem(last=False)
+        return graph
     
     @classmethod
     def register_builder(cls, name: str, builder_class: type):
         """Register a new graph builder."""
         cls._builders[name] = builder_class
+        cls._graphs.clear()
         app_logger.info(f"Registered graph builder: {name}")
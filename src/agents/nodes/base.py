@@ -61,7 +61,7 @@ class ResearchNode:
             
             results = self.search_tool.invoke(query)
             
-            sources = [r.get("url", "") for r in results if "url" in r]
+            sources = [r["url"] for r in results if "url" in r]
             
             app_logger.info(f"Found {len(results)} search results")
             return {
@@ -1,6 +1,7 @@
 """FastAPI middleware for logging, error handling, rate limiting."""
+from collections import deque
 from time import time
-from typing import Callable
+from typing import Callable, Deque, Dict
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -20,9 +21,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         
         # Log request
         app_logger.info(
-            f"Request: {request.method} {request.url.path} | "
-            f"Request ID: {request_id} | "
-            f"Client: {request.client.host}"
+            "Request: {} {} | Request ID: {} | Client: {}",
+            request.method,
+            request.url.path,
+            request_id,
+            request.client.host
         )
         
         # Process request
@@ -33,9 +36,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         
         # Log response
         app_logger.info(
-            f"Response: {response.status_code} | "
-            f"Request ID: {request_id} | "
-            f"Duration: {process_time:.3f}s"
+            "Response: {} | Request ID: {} | Duration: {:.3f}s",
+            response.status_code,
+            request_id,
+            process_time
         )
         
         # Add custom headers
@@ -79,33 +83,29 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = {}  # {ip: [(timestamp, count)]}
+        self.requests: Dict[str, Deque[float]] = {}  # {ip: deque of timestamps}
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         client_ip = request.client.host
         current_time = time()
         
-        # Clean old entries
-        if client_ip in self.requests:
-            self.requests[client_ip] = [
-                (ts, count) for ts, count in self.requests[client_ip]
-                if current_time - ts < self.window_seconds
-            ]
+        timestamps = self.requests.get(client_ip)
+        if timestamps is None:
+            timestamps = self.requests[client_ip] = deque(maxlen=self.max_requests)
         
-        # Count requests in current window
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
+        # Drop entries that have left the window (oldest first)
+        cutoff = current_time - self.window_seconds
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
         
-        request_count = sum(count for _, count in self.requests[client_ip])
-        
-        if request_count >= self.max_requests:
+        if len(timestamps) >= self.max_requests:
             app_logger.warning(f"Rate limit exceeded for {client_ip}")
             raise RateLimitException(
                 f"Rate limit exceeded. Maximum {self.max_requests} requests per {self.window_seconds} seconds."
             )
         
         # Add current request
-        self.requests[client_ip].append((current_time, 1))
+        timestamps.append(current_time)
         
         return await call_next(request)
 
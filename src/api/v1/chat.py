@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from langchain_core.messages import HumanMessage
 from src.schemas.api import ChatRequest, ChatResponse
-from src.agents.graphs.base import ChatbotWithToolsGraphBuilder
+from src.agents.graphs.base import GraphFactory
 from src.api.dependencies import get_llm
 from src.llms.base import BaseLLM
 from src.utils.logger import app_logger
@@ -27,11 +27,10 @@ async def chat(
         Chat response with AI message
     """
     try:
-        app_logger.info(f"Processing chat request: {request.message[:50]}...")
+        app_logger.info("Processing chat request: {:.50}...", request.message)
         
         # Create graph with tools
-        graph_builder = ChatbotWithToolsGraphBuilder(llm, tool_names=["web_search"])
-        graph = graph_builder.build()
+        graph = GraphFactory.create("chatbot_with_tools", llm, tool_names=["web_search"])
         
         # Create input state
         input_state = {
@@ -58,7 +57,7 @@ async def chat(
         )
         
     except Exception as e:
-        app_logger.error(f"Chat error: {str(e)}")
+        app_logger.error("Chat error: {}", e)
         raise HTTPException(status_code=500, detail=f"Chat processing failed: {str(e)}")
 
 
@@ -78,7 +77,7 @@ async def simple_chat(
         Chat response with AI message
     """
     try:
-        app_logger.info(f"Processing simple chat: {request.message[:50]}...")
+        app_logger.info("Processing simple chat: {:.50}...", request.message)
         
         # Direct LLM invocation
         messages = [HumanMessage(content=request.message)]
@@ -94,5 +93,5 @@ async def simple_chat(
         )
         
     except Exception as e:
-        app_logger.error(f"Simple chat error: {str(e)}")
+        app_logger.error("Simple chat error: {}", e)
         raise HTTPException(status_code=500, detail=f"Chat processing failed: {str(e)}")
@@ -1,13 +1,35 @@
 """Research API endpoints."""
+import asyncio
+import hashlib
+from typing import Dict
 from fastapi import APIRouter, Depends, HTTPException
 from src.schemas.api import ResearchRequest, ResearchResponse
-from src.agents.graphs.base import ResearchGraphBuilder
+from src.agents.graphs.base import GraphFactory
 from src.api.dependencies import get_llm
 from src.llms.base import BaseLLM
 from src.utils.logger import app_logger
 
 router = APIRouter(prefix="/research", tags=["Research"])
 
+# In-flight research runs keyed by request parameters (single-flight)
+_inflight: Dict[bytes, asyncio.Task] = {}
+
+
+def _request_key(request: ResearchRequest, llm: BaseLLM) -> bytes:
+    """Build the coalescing key for a research request."""
+    return hashlib.blake2b(
+        f"{type(llm).__name__}|{llm.model_name}|{llm.temperature}|"
+        f"{request.query}|{request.max_results}".encode()
+    ).digest()
+
+
+def _forget(key: bytes, task: asyncio.Task) -> None:
+    """Drop a finished research run from the in-flight table."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # Mark as retrieved when every waiter went away
+
 
 @router.post("/", response_model=ResearchResponse)
 async def research(
@@ -17,6 +39,10 @@ async def research(
     """
     Research endpoint that searches and summarizes information.
     
+    Identical concurrent requests share a single graph run. The run lives
+    in its own task, so a disconnecting caller does not cancel it for the
+    others.
+    
     Args:
         request: Research request with query
         llm: LLM instance from dependency
@@ -24,12 +50,25 @@ async def research(
     Returns:
         Research response with summary and sources
     """
+    key = _request_key(request, llm)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_run_research(request, llm))
+        task.add_done_callback(lambda t: _forget(key, t))
+        _inflight[key] = task
+    else:
+        app_logger.info("Joining in-flight research request: {}", request.query)
+        
+    return await asyncio.shield(task)
+
+
+async def _run_research(request: ResearchRequest, llm: BaseLLM) -> ResearchResponse:
+    """Run the research graph for a request."""
     try:
-        app_logger.info(f"Processing research request: {request.query}")
+        app_logger.info("Processing research request: {}", request.query)
         
         # Create research graph
-        graph_builder = ResearchGraphBuilder(llm)
-        graph = graph_builder.build()
+        graph = GraphFactory.create("research", llm)
         
         # Create input state
         input_state = {
@@ -38,7 +77,7 @@ async def research(
         }
         
         # Invoke graph
-        result = graph.invoke(input_state)
+        result = await graph.ainvoke(input_state)
         
         return ResearchResponse(
             query=request.query,
@@ -48,5 +87,5 @@ async def research(
         )
         
     except Exception as e:
-        app_logger.error(f"Research error: {str(e)}")
+        app_logger.error("Research error: {}", e)
         raise HTTPException(status_code=500, detail=f"Research failed: {str(e)}")
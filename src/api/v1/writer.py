@@ -1,7 +1,7 @@
 """Writer API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException
 from src.schemas.api import WriterRequest, WriterResponse
-from src.agents.graphs.base import WriterGraphBuilder
+from src.agents.graphs.base import GraphFactory
 from src.api.dependencies import get_llm
 from src.llms.base import BaseLLM
 from src.utils.logger import app_logger
@@ -25,11 +25,10 @@ async def write_content(
         Writer response with outline, draft, and final content
     """
     try:
-        app_logger.info(f"Processing writer request: {request.topic}")
+        app_logger.info("Processing writer request: {}", request.topic)
         
         # Create writer graph
-        graph_builder = WriterGraphBuilder(llm)
-        graph = graph_builder.build()
+        graph = GraphFactory.create("writer", llm)
         
         # Create input state
         input_state = {
@@ -50,5 +49,5 @@ async def write_content(
         )
         
     except Exception as e:
-        app_logger.error(f"Writer error: {str(e)}")
+        app_logger.error("Writer error: {}", e)
         raise HTTPException(status_code=500, detail=f"Content writing failed: {str(e)}")
@@ -3,7 +3,7 @@ Core configuration management using Pydantic Settings.
 Handles environment variables and application settings.
 """
 from functools import lru_cache
-from typing import Literal, List
+from typing import Any, Literal, Optional, Tuple
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -28,8 +28,11 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
-    workers: int = 4
+    workers: int = 2
     reload: bool = True
+    loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http: Literal["auto", "h11", "httptools"] = "auto"
+    limit_concurrency: Optional[int] = 1000
     
     # LLM API Keys
     groq_api_key: str = Field(default="", description="Groq API Key")
@@ -53,11 +56,11 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     
     # CORS
-    allowed_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8000"]
+    allowed_origins: Tuple[str, ...] = Field(
+        default=("http://localhost:3000", "http://localhost:8000")
     )
-    allowed_methods: List[str] = Field(default=["*"])
-    allowed_headers: List[str] = Field(default=["*"])
+    allowed_methods: Tuple[str, ...] = Field(default=("*",))
+    allowed_headers: Tuple[str, ...] = Field(default=("*",))
     
     # Database
     database_url: str = "sqlite:///./data/app.db"
@@ -75,7 +78,7 @@ class Settings(BaseSettings):
     @classmethod
     def parse_origins(cls, v):
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            return tuple(origin.strip() for origin in v.split(","))
         return v
     
     @property
@@ -85,6 +88,10 @@ class Settings(BaseSettings):
     @property
     def is_production(self) -> bool:
         return self.environment == "production"
+    
+    def model_post_init(self, __context: Any) -> None:
+        # Auto-reload is a development convenience only
+        self.reload = self.reload and self.is_development
 
 
 @lru_cache()
@@ -95,3 +102,4 @@ def get_settings() -> Settings:
 
 # Global settings instance
 settings = get_settings()
+
@@ -14,7 +14,9 @@ class BaseLLM(ABC):
     
     def __init__(self, model_name: Optional[str] = None, temperature: Optional[float] = None):
         self.model_name = model_name or settings.default_model
-        self.temperature = temperature or settings.default_temperature
+        self.temperature = (
+            temperature if temperature is not None else settings.default_temperature
+        )
         self._client: Optional[BaseChatModel] = None
     
     @abstractmethod
@@ -28,7 +30,7 @@ class BaseLLM(ABC):
             client = self.get_client()
             return client.invoke(messages, **kwargs)
         except Exception as e:
-            app_logger.error(f"LLM invocation failed: {str(e)}")
+            app_logger.error("LLM invocation failed: {}", e)
             raise LLMException(f"LLM invocation failed: {str(e)}")
     
     async def ainvoke(self, messages: List[Any], **kwargs) -> Any:
@@ -37,7 +39,7 @@ class BaseLLM(ABC):
             client = self.get_client()
             return await client.ainvoke(messages, **kwargs)
         except Exception as e:
-            app_logger.error(f"LLM async invocation failed: {str(e)}")
+            app_logger.error("LLM async invocation failed: {}", e)
             raise LLMException(f"LLM async invocation failed: {str(e)}")
     
     def stream(self, messages: List[Any], **kwargs):
@@ -46,7 +48,7 @@ class BaseLLM(ABC):
             client = self.get_client()
             return client.stream(messages, **kwargs)
         except Exception as e:
-            app_logger.error(f"LLM streaming failed: {str(e)}")
+            app_logger.error("LLM streaming failed: {}", e)
             raise LLMException(f"LLM streaming failed: {str(e)}")
 
 
@@ -67,7 +69,7 @@ class GroqLLM(BaseLLM):
                 temperature=self.temperature,
                 max_tokens=settings.default_max_tokens
             )
-            app_logger.info(f"Initialized Groq LLM with model: {self.model_name}")
+            app_logger.info("Initialized Groq LLM with model: {}", self.model_name)
         return self._client
 
 
@@ -88,7 +90,7 @@ class OpenAILLM(BaseLLM):
                 temperature=self.temperature,
                 max_tokens=settings.default_max_tokens
             )
-            app_logger.info(f"Initialized OpenAI LLM with model: {self.model_name}")
+            app_logger.info("Initialized OpenAI LLM with model: {}", self.model_name)
         return self._client
 
 
@@ -122,4 +124,4 @@ class LLMFactory:
     def register_provider(cls, name: str, llm_class: type):
         """Register a new LLM provider."""
         cls._providers[name] = llm_class
-        app_logger.info(f"Registered LLM provider: {name}")
+        app_logger.info("Registered LLM provider: {}", name)
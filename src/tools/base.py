@@ -1,4 +1,5 @@
 """Tools for agents - web search, custom tools, etc."""
+from functools import lru_cache
 from typing import List, Optional
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.tools import Tool
@@ -7,11 +8,17 @@ from src.core.config import settings
 from src.core.exceptions import ToolException, ConfigurationException
 from src.utils.logger import app_logger
 
+# Characters accepted by the calculator tool
+_CALCULATOR_CHARS = b"0123456789+-*/()., "
 
+
+@lru_cache(maxsize=None)
 def get_web_search_tool(max_results: int = 5) -> TavilySearchResults:
     """
     Get web search tool using Tavily.
     
+    Tool instances are stateless and shared per max_results value.
+    
     Args:
         max_results: Maximum number of search results
         
@@ -36,14 +43,14 @@ def get_web_search_tool(max_results: int = 5) -> TavilySearchResults:
         raise ToolException(f"Failed to initialize search tool: {str(e)}")
 
 
+@lru_cache(maxsize=None)
 def get_calculator_tool() -> Tool:
-    """Get calculator tool for mathematical operations."""
+    """Get calculator tool for mathematical operations (shared instance)."""
     def calculator(expression: str) -> str:
         """Evaluate a mathematical expression safely."""
         try:
             # Only allow safe mathematical operations
-            allowed_chars = set("0123456789+-*/()., ")
-            if not all(c in allowed_chars for c in expression):
+            if expression.encode().translate(None, _CALCULATOR_CHARS):
                 return "Error: Invalid characters in expression"
             
             result = eval(expression, {"__builtins__": {}}, {})
@@ -58,6 +65,13 @@ def get_calculator_tool() -> Tool:
     )
 
 
+# Tool name -> factory, used by get_available_tools
+_TOOL_FACTORIES = {
+    "web_search": get_web_search_tool,
+    "calculator": get_calculator_tool
+}
+
+
 def get_available_tools(tool_names: Optional[List[str]] = None) -> List[Tool]:
     """
     Get list of available tools.
@@ -68,22 +82,17 @@ def get_available_tools(tool_names: Optional[List[str]] = None) -> List[Tool]:
     Returns:
         List of tool instances
     """
-    all_tools = {
-        "web_search": get_web_search_tool,
-        "calculator": get_calculator_tool
-    }
-    
     if tool_names is None:
-        tool_names = list(all_tools.keys())
+        tool_names = list(_TOOL_FACTORIES.keys())
     
     tools = []
     for name in tool_names:
-        if name not in all_tools:
+        if name not in _TOOL_FACTORIES:
             app_logger.warning(f"Unknown tool requested: {name}")
             continue
         
         try:
-            tool = all_tools[name]()
+            tool = _TOOL_FACTORIES[name]()
             tools.append(tool)
             app_logger.info(f"Added tool: {name}")
         except Exception as e:
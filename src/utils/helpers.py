@@ -1,25 +1,49 @@
 """Utility helper functions."""
-import hashlib
+import asyncio
 import secrets
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import Any, Dict, Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from src.core.config import settings
 
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt and jose are imported on first use so that importing this module
+# (e.g. for generate_request_id in middleware) stays cheap
+@cache
+def _signing_key():
+    """JWT signing key, constructed once instead of on every encode/decode."""
+    from jose import jwk
+    return jwk.construct(settings.secret_key, algorithm=settings.algorithm)
 
 
 def hash_password(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    import bcrypt
+    
+    # bcrypt only uses the first 72 bytes of the password
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt()).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    if not hashed_password.startswith("$2"):
+        # Only bcrypt hashes are produced or accepted
+        return False
+    
+    import bcrypt
+    
+    return bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+
+
+async def ahash_password(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
 
 
 def generate_token(length: int = 32) -> str:
@@ -29,23 +53,28 @@ def generate_token(length: int = 32) -> str:
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
+    from jose import jwt
+    
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+    if expires_delta is not None:
+        expires_in = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        expires_in = settings.access_token_expire_minutes * 60
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    # JWT "exp" is a Unix timestamp; no datetime object needed
+    to_encode["exp"] = int(time.time()) + expires_in
+    encoded_jwt = jwt.encode(to_encode, _signing_key(), algorithm=settings.algorithm)
     
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """Decode JWT access token."""
+    from jose import JWTError, jwt
+    
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(token, _signing_key(), algorithms=[settings.algorithm])
         return payload
     except JWTError:
         return None
@@ -53,25 +82,18 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
 
 def generate_request_id() -> str:
     """Generate unique request ID."""
-    return hashlib.sha256(
-        f"{datetime.utcnow().isoformat()}{secrets.token_hex(16)}".encode()
-    ).hexdigest()[:16]
+    return secrets.token_hex(8)
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
     """Format datetime to ISO string."""
     if dt is None:
-        dt = datetime.utcnow()
+        dt = datetime.now(timezone.utc)
     return dt.isoformat()
 
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
     """Sanitize user input."""
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    # Truncate if too long
-    if len(text) > max_length:
-        text = text[:max_length]
-    
-    return text
+    # Strip, then truncate; both return the input unchanged when there is
+    # nothing to remove, so short clean input is not copied
+    return text.strip()[:max_length]
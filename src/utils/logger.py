@@ -11,15 +11,17 @@ def setup_logging():
     # Remove default handler
     logger.remove()
     
-    # Console handler with color
+    # Console handler, colored only on a terminal; queued in production so
+    # request handlers never block on the stream
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=settings.log_level,
-        colorize=True,
+        colorize=sys.stderr.isatty(),
+        enqueue=settings.is_production,
     )
     
-    # File handler for all logs
+    # File handlers write (and rotate/compress) on a background queue
     log_path = Path("logs")
     log_path.mkdir(exist_ok=True)
     
@@ -30,6 +32,7 @@ def setup_logging():
         level="DEBUG",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         compression="zip",
+        enqueue=True,
     )
     
     # Error file handler
@@ -40,6 +43,7 @@ def setup_logging():
         level="ERROR",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         compression="zip",
+        enqueue=True,
         backtrace=True,
         diagnose=True,
     )
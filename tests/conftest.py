@@ -1,22 +1,35 @@
 """Test configuration and fixtures."""
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from main import app
 from src.core.config import settings
+from src.llms.base import BaseLLM, LLMFactory
 
 
-@pytest.fixture
-def test_settings():
-    """Test settings fixture."""
-    settings.environment = "test"
-    settings.debug = True
-    return settings
+@pytest_asyncio.fixture
+async def aclient():
+    """Async test client calling the app in-process over ASGI."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
 
 
-@pytest.fixture
-def client():
-    """Test client fixture."""
-    from main import app
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def groq_llm():
+    """Groq LLM built once per session with a dummy API key."""
+    # Patch the key only while constructing, so later tests see real settings
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "groq_api_key", "test-key")
+        llm = LLMFactory.create(provider="groq")
+    return llm
+
+
+class DummyLLM(BaseLLM):
+    """BaseLLM with no backing client, for tests that only need its config."""
+    
+    def get_client(self):
+        return None
 
 
 @pytest.fixture
@@ -2,26 +2,29 @@
 import pytest
 
 
-def test_health_check(client):
+@pytest.mark.asyncio
+async def test_health_check(aclient):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = await aclient.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
 
 
-def test_root_endpoint(client):
+@pytest.mark.asyncio
+async def test_root_endpoint(aclient):
     """Test root endpoint."""
-    response = client.get("/")
+    response = await aclient.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
 
 
-def test_info_endpoint(client):
+@pytest.mark.asyncio
+async def test_info_endpoint(aclient):
     """Test info endpoint."""
-    response = client.get("/info")
+    response = await aclient.get("/info")
     assert response.status_code == 200
     data = response.json()
     assert "agent_type" in data
@@ -0,0 +1,29 @@
+"""Unit tests for graph builders and factory."""
+from src.agents.graphs.base import GraphFactory
+from tests.conftest import DummyLLM
+
+
+class CountingBuilder:
+    builds = 0
+    
+    def __init__(self, llm, **kwargs):
+        self.llm = llm
+    
+    def build(self):
+        CountingBuilder.builds += 1
+        return object()
+
+
+def test_graph_factory_reuses_compiled_graph(monkeypatch):
+    """Test identical graph requests share one compiled graph."""
+    monkeypatch.setitem(GraphFactory._builders, "counting", CountingBuilder)
+    monkeypatch.setattr(GraphFactory, "_graphs", type(GraphFactory._graphs)())
+    CountingBuilder.builds = 0
+    
+    first = GraphFactory.create("counting", DummyLLM(model_name="m", temperature=0.1))
+    second = GraphFactory.create("counting", DummyLLM(model_name="m", temperature=0.1))
+    other = GraphFactory.create("counting", DummyLLM(model_name="m", temperature=0.9))
+    
+    assert first is second
+    assert other is not first
+    assert CountingBuilder.builds == 2
@@ -0,0 +1,75 @@
+"""Unit tests for helper utilities."""
+import time
+from datetime import timedelta
+import pytest
+from src.utils.helpers import (
+    ahash_password,
+    averify_password,
+    create_access_token,
+    decode_access_token,
+    generate_request_id,
+    hash_password,
+    sanitize_input,
+    verify_password,
+)
+
+
+def test_access_token_round_trip():
+    """Test a created token decodes to its claims."""
+    token = create_access_token({"sub": "user-1"})
+    payload = decode_access_token(token)
+    
+    assert payload is not None
+    assert payload["sub"] == "user-1"
+    assert "exp" in payload
+
+
+def test_decode_rejects_invalid_and_expired_tokens():
+    """Test tampered and expired tokens decode to None."""
+    token = create_access_token({"sub": "user-1"})
+    expired = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-1))
+    
+    assert decode_access_token(token + "x") is None
+    assert decode_access_token(expired) is None
+
+
+def test_generate_request_id_format():
+    """Test request IDs are 16 hex characters."""
+    request_id = generate_request_id()
+    
+    assert len(request_id) == 16
+    int(request_id, 16)
+
+
+def test_access_token_expiry_is_unix_timestamp():
+    """Test token expiry honours the requested lifetime."""
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(minutes=5))
+    payload = decode_access_token(token)
+    
+    assert isinstance(payload["exp"], int)
+    assert 295 <= payload["exp"] - time.time() <= 300
+
+
+def test_sanitize_input_strips_then_truncates():
+    """Test whitespace is stripped before the length limit applies."""
+    assert sanitize_input("   hello world  ", max_length=5) == "hello"
+    assert sanitize_input("short", max_length=10) == "short"
+
+
+def test_password_hash_round_trip():
+    """Test a hashed password verifies and a wrong one does not."""
+    hashed = hash_password("s3cret")
+    
+    assert hashed.startswith("$2b$")
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("s3cret", "s3cret")
+    assert not verify_password("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_async_password_hash_round_trip():
+    """Test async password helpers match the sync ones."""
+    hashed = await ahash_password("s3cret")
+    
+    assert await averify_password("s3cret", hashed)
+    assert verify_password("s3cret", hashed)
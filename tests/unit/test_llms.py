@@ -1,19 +1,41 @@
 """Unit tests for LLM module."""
 import pytest
-from src.llms.base import LLMFactory
+from src.core.config import settings
+from src.llms.base import GroqLLM, LLMFactory
 from src.core.exceptions import ConfigurationException
+from tests.conftest import DummyLLM
 
 
-def test_llm_factory_groq(monkeypatch):
+def test_llm_factory_groq(groq_llm):
     """Test LLM factory creates Groq LLM."""
-    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    assert groq_llm is not None
+    assert groq_llm.model_name is not None
+
+
+def test_groq_client_built_without_network(monkeypatch):
+    """Test the Groq client is built from settings with ChatGroq mocked out."""
+    created = {}
+    
+    class FakeChatGroq:
+        def __init__(self, **kwargs):
+            created.update(kwargs)
     
-    llm = LLMFactory.create(provider="groq")
-    assert llm is not None
-    assert llm.model_name is not None
+    monkeypatch.setattr(settings, "groq_api_key", "test-key")
+    monkeypatch.setattr("src.llms.base.ChatGroq", FakeChatGroq)
+    
+    client = GroqLLM(model_name="mock-model").get_client()
+    assert isinstance(client, FakeChatGroq)
+    assert created["model"] == "mock-model"
+    assert created["api_key"] == "test-key"
 
 
 def test_llm_factory_invalid_provider():
     """Test LLM factory raises error for invalid provider."""
     with pytest.raises(ConfigurationException):
         LLMFactory.create(provider="invalid")
+
+
+def test_llm_zero_temperature_preserved():
+    """Test an explicit zero temperature is not replaced by the default."""
+    assert DummyLLM(temperature=0.0).temperature == 0.0
+    assert DummyLLM().temperature is not None
@@ -0,0 +1,45 @@
+"""Unit tests for API middlewares."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.middlewares.base import RateLimitMiddleware
+from src.core.exceptions import RateLimitException
+
+
+def _app(max_requests: int, window_seconds: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        max_requests=max_requests,
+        window_seconds=window_seconds
+    )
+    
+    @app.get("/")
+    async def root():
+        return {"ok": True}
+        
+    return app
+
+
+def test_rate_limit_blocks_after_max_requests():
+    """Test rate limiter rejects requests over the limit."""
+    client = TestClient(_app(max_requests=2, window_seconds=60))
+    
+    assert client.get("/").status_code == 200
+    assert client.get("/").status_code == 200
+    with pytest.raises(RateLimitException):
+        client.get("/")
+
+
+def test_rate_limit_window_expires(monkeypatch):
+    """Test rate limiter accepts requests again once the window passes."""
+    now = [1000.0]
+    monkeypatch.setattr("src.api.middlewares.base.time", lambda: now[0])
+    client = TestClient(_app(max_requests=1, window_seconds=60))
+    
+    assert client.get("/").status_code == 200
+    with pytest.raises(RateLimitException):
+        client.get("/")
+        
+    now[0] += 60
+    assert client.get("/").status_code == 200
@@ -0,0 +1,88 @@
+"""Unit tests for research request coalescing."""
+import asyncio
+import pytest
+from fastapi import HTTPException
+from src.api.v1 import research as research_api
+from src.schemas.api import ResearchRequest, ResearchResponse
+from tests.conftest import DummyLLM
+
+
+class FakeRun:
+    """Stand-in for _run_research that blocks until released."""
+    
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+        self.release = asyncio.Event()
+    
+    async def __call__(self, request, llm):
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return ResearchResponse(query=request.query, summary="summary", sources=[])
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    monkeypatch.setattr(research_api, "_inflight", {})
+    
+    def install(error: Exception = None) -> FakeRun:
+        run = FakeRun(error)
+        monkeypatch.setattr(research_api, "_run_research", run)
+        return run
+        
+    return install
+
+
+def _call():
+    request = ResearchRequest(query="q")
+    llm = DummyLLM(model_name="m", temperature=0.1)
+    return asyncio.create_task(research_api.research(request, llm))
+
+
+@pytest.mark.asyncio
+async def test_duplicate_requests_share_one_run(fake_run):
+    """Test identical concurrent requests run the graph once."""
+    run = fake_run()
+    first, second = _call(), _call()
+    await asyncio.sleep(0)
+    run.release.set()
+    
+    results = await asyncio.gather(first, second)
+    
+    assert run.calls == 1
+    assert results[0] is results[1]
+    assert research_api._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_run_error_reaches_all_waiters(fake_run):
+    """Test a failed run is reported to every coalesced request."""
+    run = fake_run(HTTPException(status_code=500, detail="boom"))
+    first, second = _call(), _call()
+    await asyncio.sleep(0)
+    run.release.set()
+    
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    
+    assert run.calls == 1
+    assert all(isinstance(r, HTTPException) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_leader_cancellation_does_not_fail_joiners(fake_run):
+    """Test cancelling the first caller leaves the shared run intact."""
+    run = fake_run()
+    leader, joiner = _call(), _call()
+    await asyncio.sleep(0)
+    
+    leader.cancel()
+    await asyncio.sleep(0)
+    run.release.set()
+    
+    result = await joiner
+    
+    assert leader.cancelled()
+    assert result.query == "q"
+    assert run.calls == 1
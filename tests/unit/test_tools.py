@@ -0,0 +1,15 @@
+"""Unit tests for agent tools."""
+from src.tools.base import get_calculator_tool
+
+
+def test_calculator_evaluates_expression():
+    """Test calculator evaluates a simple expression."""
+    calculator = get_calculator_tool()
+    assert calculator.func("2 + 2 * 3") == "8"
+
+
+def test_calculator_rejects_invalid_characters():
+    """Test calculator rejects names and non-ASCII input."""
+    calculator = get_calculator_tool()
+    assert calculator.func("__import__('os')").startswith("Error: Invalid characters")
+    assert calculator.func("2 × 3").startswith("Error: Invalid characters")